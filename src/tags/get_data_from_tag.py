@@ -4,7 +4,7 @@ Author: Edmund Bennett
 Copyright 2024
 """
 
-from src.utils import logger as log
+from src.utils.logger import logger as log
 
 
 def get_data_from_tag(tag, data):
@@ -5,10 +5,9 @@ Copyright 2024
 """
 
 from typing import Any
-import re
 
 from .get_data_from_tag import get_data_from_tag
-from src.utils import logger as log
+from src.utils.logger import logger as log
 
 
 def process_tag(
@@ -16,11 +15,12 @@ def process_tag(
     data: list[dict[str, Any]],
 ):
     """
-    Recursive function to process a tag and return its content.
-    If the tag contains one or more other tag, it processes the inner tags first.
+    Process a tag and return its content.
+    If the tag contains one or more other tags, the innermost tags are processed first
+    in a single left-to-right scan.
 
     Args:
-        tag (str): The tag to process, e.g. '{{Report_Title}}' or '{{Outer_Tag {{Inner_Tag}}}}'.
+        tag (str): The tag to process, e.g. '[[Report_Title]]' or '[[Outer_Tag [[Inner_Tag]]]]'.
         data (dict): A dictionary containing tag-to-content mapping.
 
     Returns:
@@ -28,17 +28,47 @@ def process_tag(
     """
     log.function_call()
 
-    tag_pattern: str = r"\[\[(.*?)\]\]"
-
-    if not re.search(tag_pattern, tag):
+    first_open_index = tag.find("[[")
+    if first_open_index == -1 or tag.find("]]", first_open_index + 2) == -1:
         return get_data_from_tag(
             tag=tag,
             data=data,
         )
 
-    while re.search(tag_pattern, tag):
-        inner_tag = re.search(tag_pattern, tag)[0]
-        inner_content = process_tag(inner_tag, data)
-        tag = tag.replace(inner_tag, inner_content)
+    # Each open tag gets its own list of fragments, joined once when its closing brackets are found
+    fragments: list[list[str]] = [[]]
+    # Tags repeated within the same template are only resolved once
+    resolved_tags: dict[str, str] = {}
+    position = 0
+    # Delimiter positions are only searched for again once the scan has moved past them
+    open_index = first_open_index
+    close_index = tag.find("]]")
+    while close_index != -1:
+        if open_index != -1 and open_index < close_index:
+            fragments[-1].append(tag[position:open_index])
+            fragments.append(["[["])
+            position = open_index + 2
+            open_index = tag.find("[[", position)
+            continue
+
+        fragments[-1].append(tag[position:close_index])
+        if len(fragments) == 1:  # unmatched closing brackets are kept as text
+            fragments[-1].append("]]")
+        else:
+            inner_fragments = fragments.pop()
+            inner_fragments.append("]]")
+            inner_tag = "".join(inner_fragments)
+            inner_content = resolved_tags.get(inner_tag)
+            if inner_content is None:
+                inner_content = get_data_from_tag(
+                    tag=inner_tag,
+                    data=data,
+                )
+                resolved_tags[inner_tag] = inner_content
+            fragments[-1].append(inner_content)
+        position = close_index + 2
+        close_index = tag.find("]]", position)
+
+    fragments[-1].append(tag[position:])
 
-    return tag
+    return "".join("".join(unclosed) for unclosed in fragments)
@@ -5,15 +5,14 @@ Copyright 2024
 """
 
 from typing import Callable, Optional, Any
-from types import FrameType
 from logging import Logger, Formatter, StreamHandler, getLogger, INFO, setLoggerClass
 from concurrent_log_handler import ConcurrentRotatingFileHandler
 from tempfile import gettempdir
-from re import search, match
-from os.path import join, basename
+import re
+from os.path import join
 from datetime import datetime
+from sys import _getframe
 import time
-import inspect
 
 
 # Subclass the Logger class to add the custom method
@@ -32,35 +31,29 @@ class CustomLogger(Logger):
         >>>
         >>> 2016-05-28 00:00:00.000 INFO     [some_file.py:22] Calling some_function
         """
-        currentframe: Optional[FrameType] = inspect.currentframe()
-        if currentframe is not None and currentframe.f_back is not None:
-            frame = inspect.currentframe().f_back
-            func_name = frame.f_code.co_name
-            file_path = frame.f_code.co_filename
-            file_name = basename(file_path)
-            line_number = frame.f_lineno
+        if not self.isEnabledFor(INFO):
+            return
 
-            # Create a temporary formatter with the correct file and line information
-            temp_formatter = WhitespaceRemovingFormatter(
-                f"%(asctime)s.%(msecs)03d %(levelname)s [{file_name}:{line_number}] %(message)s",
-                "%Y-%m-%d %H:%M:%S",
-            )
-
-            # Store the original formatters
-            original_formatters = [
-                (handler, handler.formatter) for handler in self.handlers
-            ]
-
-            # Set the temporary formatter
-            for handler in self.handlers:
-                handler.setFormatter(temp_formatter)
-
-            # Log the function call
-            self.info(f"Calling {func_name}")
-
-            # Restore the original formatters
-            for handler, formatter in original_formatters:
-                handler.setFormatter(formatter)
+        try:
+            frame = _getframe(1)
+        except ValueError:
+            return
+
+        # Build the record against the caller's frame so the shared formatter
+        # reports its file and line number
+        code = frame.f_code
+        func_name = code.co_name
+        record = self.makeRecord(
+            self.name,
+            INFO,
+            code.co_filename,
+            frame.f_lineno,
+            "Calling %s",
+            (func_name,),
+            None,
+            func=func_name,
+        )
+        self.handle(record)
 
 
 def function_timer(log_result: bool = False) -> Callable:
@@ -77,12 +70,16 @@ def function_timer(log_result: bool = False) -> Callable:
     """
 
     def decorator(func):
+        func_name = func.__name__
+
         def wrapper(*args, **kwargs):
             start_time = time.time()
             output = func(*args, **kwargs)
             finish_time = time.time()
             elapsed_time = finish_time - start_time
-            msg = f"{func._name_} took {elapsed_time:.4f}s to run."
+            # Formatting is deferred to the handlers, which skip it if INFO is disabled
+            msg = "%s took %.4fs to run."
+            msg_args: list[Any] = [func_name, elapsed_time]
 
             try:
                 if log_result:
@@ -95,12 +92,13 @@ def function_timer(log_result: bool = False) -> Callable:
                         f"{key} has a value of {value}" for key, value in result.items()
                     ]
                     log_results = "\n".join(log_results)
-                    msg += f"where...\n{log_results}"
+                    msg += "where...\n%s"
+                    msg_args.append(log_results)
 
             except Exception as e:
                 logger.warning(f"Error: {e}")
             finally:
-                logger.info(msg)
+                logger.info(msg, *msg_args)
 
             return output
 
@@ -124,9 +122,12 @@ class WhitespaceRemovingFormatter(Formatter):
     MAX_LENGTH: int = 10000
 
     def format(self, record):
-        record.msg = record.msg.strip()
-        if len(record.msg) > WhitespaceRemovingFormatter.MAX_LENGTH:
-            record.msg = f"{record.msg[: WhitespaceRemovingFormatter.MAX_LENGTH]}..."
+        # Work on the rendered message so deferred logging arguments are also stripped and truncated
+        message = record.getMessage().strip()
+        if len(message) > WhitespaceRemovingFormatter.MAX_LENGTH:
+            message = f"{message[: WhitespaceRemovingFormatter.MAX_LENGTH]}..."
+        record.msg = message
+        record.args = None
         return super(__class__, self).format(record)
 
 
@@ -172,13 +173,17 @@ class LogScraper:
         log_content = scraper.scrape_log()
     """
 
-    TIMESTAMP_REGEX = (
-        r"2[0-9]{3}-[0-1][0-9]-[0-3][0-9] [0-2][0-9]:[0-5][0-9]:[0-5][0-9].[0-9]{3}"
+    __slots__ = ("log_file_path",)
+
+    # Matches lines written by the module-level formatter, capturing each field in one pass
+    _LINE_RE: re.Pattern = re.compile(
+        r"(?P<timestamp>[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3}) "
+        r"(?P<log_level>[A-Z]{4,}) "
+        r"\[(?P<log_filename>[^\]:]+):(?P<log_line_number>[0-9]+)]"
+        r"(?P<content>.*)"
     )
-    LOG_LEVEL_REGEX = r"[A-Z]{4,}"
-    FILENAME_LINE_NUMBER_REGEX = r"\[([a-zA-Z0-9_.:]+)]"
 
-    def _init_(
+    def __init__(
         self,
         log_file_path: str,  # C:\Users\EBennett\AppData\Local\Temp
     ) -> None:
@@ -206,69 +211,43 @@ class LogScraper:
             Tracebacks are appended to the most recent log entry.
         """
         logger.info("Calling scrape_log")
-        log_lines = None
         with open(self.log_file_path, "r") as log_file:
-            log_lines = log_file.readlines()
-
-        if log_lines is not None:
-            logger.info("Log read successful. Scraping log.")
-
             parsed_log_entries: list[Optional[dict[str, Any]]] = []
+            # traceback list of the most recent entry; lines before the first entry are discarded
+            current_traceback: list[str] = []
+            # local aliases avoid repeated attribute lookups in the per-line loop
+            match_log_line = self._LINE_RE.match
+            parse_timestamp = datetime.fromisoformat
+            append_entry = parsed_log_entries.append
             for (
                 log_content
             ) in (
-                log_lines
-            ):  # for each log line, regex matches are removed until all that remains is the content
-                log_date: Optional[datetime] = None
-                timestamp_search_result = search(self.TIMESTAMP_REGEX, log_content)
-                if timestamp_search_result is not None:
-                    log_date = datetime.fromisoformat(timestamp_search_result.group())
-                    log_content = log_content.replace(
-                        timestamp_search_result.group(), ""
-                    ).strip()
+                log_file
+            ):  # each log line is matched once, with whatever follows the prefix as its content
+                log_line_match = match_log_line(log_content)
 
                 if (
-                    log_date is None
+                    log_line_match is None
                 ):  # this approach will fail if the log does not start with an ISO datetime, or if the traceback DOES start with one
-                    logger.info(
+                    # logged at debug so the scraper does not append to the file it is streaming
+                    logger.debug(
                         "Log line does not start with timestamp. Assuming traceback found and appending to last record."
                     )
-                    parsed_log_entries[-1]["traceback"].append(log_content)  # type: ignore [index]
+                    current_traceback.append(log_content)
                     continue
 
-                log_level: Optional[str] = None
-                log_level_search_result = search(self.LOG_LEVEL_REGEX, log_content)
-                if log_level_search_result is not None:
-                    log_level = log_level_search_result.group()
-                    log_content = log_content.replace(
-                        log_level_search_result.group(), ""
-                    ).strip()
-
-                log_filename: Optional[str] = None
-                log_line_number: Optional[str] = None
-                filename_line_number_search_result = match(
-                    self.FILENAME_LINE_NUMBER_REGEX, log_content
-                )
-                if filename_line_number_search_result is not None:
-                    (
-                        log_filename,
-                        log_line_number,
-                    ) = filename_line_number_search_result.groups()[0].split(":")
-                    log_content = log_content.replace(
-                        filename_line_number_search_result.group(), ""
-                    ).strip()
-
-                parsed_log_entries.append(
+                current_traceback = []
+                append_entry(
                     {
-                        "log_date": log_date,
-                        "log_level": log_level,
-                        "log_filename": log_filename,
-                        "log_line_number": (
-                            int(log_line_number) if log_line_number else 0
-                        ),
-                        "content": log_content,
-                        "traceback": [],
+                        "log_date": parse_timestamp(log_line_match["timestamp"]),
+                        "log_level": log_line_match["log_level"],
+                        "log_filename": log_line_match["log_filename"],
+                        "log_line_number": int(log_line_match["log_line_number"]),
+                        "content": log_line_match["content"].strip(),
+                        "traceback": current_traceback,
                     }
                 )
 
-            return parsed_log_entries
+        logger.info("Log read successful.")
+
+        return parsed_log_entries